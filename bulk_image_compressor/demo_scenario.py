@@ -1,5 +1,4 @@
 import os
-import shutil
 from PIL import Image, ImageDraw
 from main import compress_img
 
@@ -17,11 +16,14 @@ def ensure_dirs():
 
 def print_sizes(folder, label=""):
     print(f"\n{label} sizes:")
-    for fn in sorted(os.listdir(folder)):
-        path = os.path.join(folder, fn)
-        if os.path.isfile(path):
-            size = os.path.getsize(path)
-            print(f" - {fn}: {size/1024:.1f} KB")
+    # scandir serves is_file()/stat() from the readdir cache, so this is
+    # one syscall per entry instead of readdir + two stat()s
+    with os.scandir(folder) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        if entry.is_file(follow_symlinks=False):
+            size = entry.stat().st_size
+            print(f" - {entry.name}: {size/1024:.1f} KB")
 
 
 def run_demo():
@@ -30,10 +32,13 @@ def run_demo():
     print_sizes(BEFORE_DIR, "Before compression (originals)")
 
     # Compress each file in BEFORE_DIR, then move the compressed file to AFTER_DIR
-    for fn in sorted(os.listdir(BEFORE_DIR)):
-        src = os.path.join(BEFORE_DIR, fn)
-        if not os.path.isfile(src):
+    with os.scandir(BEFORE_DIR) as it:
+        before_entries = sorted(it, key=lambda e: e.name)
+    for entry in before_entries:
+        if not entry.is_file(follow_symlinks=False):
             continue
+        fn = entry.name
+        src = entry.path
         name, ext = os.path.splitext(fn)
         # choose whether to convert to jpg: keep png as png, keep jpg as jpg
         to_jpg = False if ext.lower() == ".png" else True
@@ -49,10 +54,10 @@ def run_demo():
             # keep same basename but use compressed file's extension
             dest = os.path.join(AFTER_DIR, f"{name}{comp_ext}")
 
-        # If destination exists, overwrite
-        if os.path.exists(dest):
-            os.remove(dest)
-        shutil.move(compressed_path, dest)
+        # os.replace is a single atomic rename() that overwrites dest;
+        # no need for the exists/remove dance or shutil.move's copy fallback
+        # (source and destination live on the same filesystem here)
+        os.replace(compressed_path, dest)
         print(f"Compressed {fn} -> {os.path.basename(dest)}")
 
     print_sizes(AFTER_DIR, "After compression (same filenames in different folder)")
@@ -0,0 +1,22 @@
+#!/bin/sh
+# Build Pillow against libjpeg-turbo with AVX2 so every PIL.Image.open/save
+# in the bulk tools gets SIMD-accelerated JPEG decode/encode.
+#
+# Bulk runs of ex.py assume this environment; BulkImageConverter warns at
+# startup if Pillow is linked against a slower JPEG library.
+set -e
+
+conda install -y -c conda-forge libjpeg-turbo
+
+pip uninstall -y pillow
+CFLAGS="-mavx2" pip install --no-binary :all: --force-reinstall --compile pillow
+
+# Alternative: Pillow-SIMD is a drop-in replacement whose AVX2 build also
+# vectorizes the resize/encode inner loops (ex.py logs when it detects it):
+#   pip uninstall -y pillow
+#   CFLAGS="-mavx2" pip install pillow-simd
+
+# Optional: the turbojpeg fast path used by ex.py
+pip install PyTurboJPEG
+
+python -c "from PIL import features; features.pilinfo(supported_formats=False)"
@@ -1,13 +1,31 @@
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import csv
 import os
+import re
+import shutil
 import time
+import asyncio
+from pathlib import Path
 from urllib.parse import urlparse
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 from tqdm import tqdm
 import argparse
 
+# Optional async stack: one event loop holds far more in-flight downloads
+# than a thread pool. Falls back to threads when not installed.
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -15,6 +33,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Characters stripped from generated filenames, compiled once
+_UNSAFE_CHARS_RE = re.compile(r'[^A-Za-z0-9._-]')
+
+# Magic prefixes of the image formats we accept
+_IMAGE_MAGIC = (
+    b'\xff\xd8\xff',        # JPEG
+    b'\x89PNG\r\n\x1a\n',   # PNG
+    b'GIF87a',              # GIF
+    b'GIF89a',
+    b'BM',                  # BMP
+)
+
+
+def _looks_like_image(head):
+    """Check the leading bytes of a payload against known image magic"""
+    if head.startswith(b'RIFF') and head[8:12] == b'WEBP':
+        return True
+    return head.startswith(_IMAGE_MAGIC)
+
 class ExcelImageDownloader:
     def __init__(self, excel_path, url_column='url', output_dir='downloaded_images',
                  max_workers=5, timeout=30, headers=None):
@@ -32,15 +69,30 @@ class ExcelImageDownloader:
         self.excel_path = excel_path
         self.url_column = url_column
         self.output_dir = output_dir
+        self.output_path = Path(output_dir)
+        # Filenames already present in the output dir; refreshed once per
+        # batch so the skip check is a hash lookup, not a stat() per image
+        self._existing = set()
         self.max_workers = max_workers
         self.timeout = timeout
         self.headers = headers or {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
+        # Shared session so the worker threads reuse pooled TCP/TLS
+        # connections instead of paying a handshake per image
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=max_workers,
+            pool_maxsize=max_workers * 2,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
         # Create output directory if it doesn't exist
         os.makedirs(self.output_dir, exist_ok=True)
-        
+
     def load_excel_data(self):
         """Load data from Excel file"""
         try:
@@ -101,9 +153,9 @@ class ExcelImageDownloader:
                         filename = f"{safe_name}{ext}"
                         break
             
-            # Ensure filename is safe
-            safe_chars = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_.")
-            filename = ''.join(c for c in filename if c in safe_chars)
+            # Ensure filename is safe (single C-level regex pass instead of
+            # a per-character generator over a set)
+            filename = _UNSAFE_CHARS_RE.sub('', filename)
             
             return filename
             
@@ -114,31 +166,56 @@ class ExcelImageDownloader:
     def download_image(self, url, filename, index):
         """Download a single image"""
         try:
-            # Skip if file already exists
-            filepath = os.path.join(self.output_dir, filename)
-            if os.path.exists(filepath):
+            # Skip if file already exists (set membership, no stat)
+            filepath = self.output_path / filename
+            if filename in self._existing:
                 logger.debug(f"File already exists: {filename}")
                 return {'index': index, 'url': url, 'filename': filename, 'status': 'skipped', 'error': None}
             
-            # Send request with headers and timeout
-            response = requests.get(
-                url, 
-                headers=self.headers, 
+            # Probe the first bytes and validate image magic before pulling
+            # the full body; content-type alone misclassifies CDNs that
+            # serve application/octet-stream
+            probe = self.session.get(
+                url,
+                headers={**self.headers, 'Range': 'bytes=0-15'},
                 timeout=self.timeout,
                 stream=True
             )
-            response.raise_for_status()
-            
-            # Check if content is an image
-            content_type = response.headers.get('content-type', '')
-            if 'image' not in content_type:
+            try:
+                probe.raise_for_status()
+                # Decode any content-encoding (gzip/deflate) so the probe
+                # sees image magic, not compression magic
+                probe.raw.decode_content = True
+                head = probe.raw.read(16)
+            finally:
+                probe.close()
+
+            if head and not _looks_like_image(head):
                 logger.warning(f"URL does not point to an image: {url}")
                 return {'index': index, 'url': url, 'filename': filename, 'status': 'failed', 'error': 'Not an image'}
+
+            # Send request with headers and timeout
+            response = self.session.get(
+                url,
+                headers=self.headers,
+                timeout=self.timeout,
+                stream=True
+            )
+            response.raise_for_status()
+
+            # Magic probe came back empty (unusual server): fall back to
+            # the content-type heuristic
+            if not head:
+                content_type = response.headers.get('content-type', '')
+                if 'image' not in content_type:
+                    logger.warning(f"URL does not point to an image: {url}")
+                    return {'index': index, 'url': url, 'filename': filename, 'status': 'failed', 'error': 'Not an image'}
             
-            # Save the image
+            # Save the image; copyfileobj streams in C with a 1 MiB buffer
+            # instead of running Python once per 8 KiB chunk
+            response.raw.decode_content = True
             with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                shutil.copyfileobj(response.raw, f, length=1024 * 1024)
             
             logger.debug(f"Downloaded: {filename}")
             return {'index': index, 'url': url, 'filename': filename, 'status': 'success', 'error': None}
@@ -150,6 +227,73 @@ class ExcelImageDownloader:
             logger.error(f"Unexpected error downloading {url}: {e}")
             return {'index': index, 'url': url, 'filename': filename, 'status': 'failed', 'error': str(e)}
     
+    async def _download_image_async(self, session, sem, url, filename, index):
+        """Async counterpart of download_image, used when aiohttp is available"""
+        filepath = self.output_path / filename
+        if filename in self._existing:
+            logger.debug(f"File already exists: {filename}")
+            return {'index': index, 'url': url, 'filename': filename, 'status': 'skipped', 'error': None}
+
+        try:
+            async with sem:
+                async with session.get(url, headers=self.headers) as response:
+                    response.raise_for_status()
+
+                    # Validate by magic bytes: the stream is already open,
+                    # so peek at the first 16 bytes before writing anything.
+                    # An empty head is inconclusive (mirrors the sync path):
+                    # fall back to the content-type heuristic
+                    head = await response.content.read(16)
+                    if head and not _looks_like_image(head):
+                        logger.warning(f"URL does not point to an image: {url}")
+                        return {'index': index, 'url': url, 'filename': filename, 'status': 'failed', 'error': 'Not an image'}
+                    if not head:
+                        content_type = response.headers.get('content-type', '')
+                        if 'image' not in content_type:
+                            logger.warning(f"URL does not point to an image: {url}")
+                            return {'index': index, 'url': url, 'filename': filename, 'status': 'failed', 'error': 'Not an image'}
+
+                    if aiofiles is not None:
+                        async with aiofiles.open(filepath, 'wb') as f:
+                            await f.write(head)
+                            async for chunk in response.content.iter_chunked(1 << 16):
+                                await f.write(chunk)
+                    else:
+                        # Blocking writes are acceptable here; image chunks
+                        # are small compared to the network waits
+                        with open(filepath, 'wb') as f:
+                            f.write(head)
+                            async for chunk in response.content.iter_chunked(1 << 16):
+                                f.write(chunk)
+
+            logger.debug(f"Downloaded: {filename}")
+            return {'index': index, 'url': url, 'filename': filename, 'status': 'success', 'error': None}
+
+        except aiohttp.ClientError as e:
+            logger.warning(f"Failed to download {url}: {e}")
+            return {'index': index, 'url': url, 'filename': filename, 'status': 'failed', 'error': str(e)}
+        except Exception as e:
+            logger.error(f"Unexpected error downloading {url}: {e}")
+            return {'index': index, 'url': url, 'filename': filename, 'status': 'failed', 'error': str(e)}
+
+    async def _download_all_async(self, tasks):
+        """Run all downloads on one event loop with bounded concurrency"""
+        sem = asyncio.Semaphore(self.max_workers)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        connector = aiohttp.TCPConnector(limit=self.max_workers * 2)
+
+        results = []
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+            coros = [
+                self._download_image_async(session, sem, url, filename, i)
+                for url, filename, i in tasks
+            ]
+            with tqdm(total=len(coros), desc="Downloading images") as pbar:
+                for coro in asyncio.as_completed(coros):
+                    results.append(await coro)
+                    pbar.update(1)
+        return results
+
     def download_all_images(self, df, urls):
         """Download all images with progress tracking"""
         results = []
@@ -157,39 +301,50 @@ class ExcelImageDownloader:
         
         logger.info(f"Starting download of {len(urls)} images to '{self.output_dir}'")
         logger.info(f"Using {self.max_workers} parallel workers")
+
+        # One listing up front replaces a stat() per image in the workers
+        self._existing = set(os.listdir(self.output_dir)) if os.path.isdir(self.output_dir) else set()
         
+        # Index rows by URL once so each lookup below is a hash lookup
+        # instead of an O(N) dataframe scan per URL
+        row_by_url = {}
+        if df is not None:
+            for _, row in df.iterrows():
+                row_by_url.setdefault(str(row[self.url_column]), row.to_dict())
+
         # Prepare tasks
         tasks = []
         for i, url in enumerate(urls):
             # Get corresponding row from dataframe if available
-            df_row = None
-            if df is not None:
-                # Find the row with this URL
-                matching_rows = df[df[self.url_column] == url]
-                if not matching_rows.empty:
-                    df_row = matching_rows.iloc[0].to_dict()
-            
+            df_row = row_by_url.get(url)
+
             filename = self.get_filename(url, i, df_row)
             tasks.append((url, filename, i))
         
-        # Download images in parallel
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_task = {
-                executor.submit(self.download_image, url, filename, i): (url, filename, i)
-                for url, filename, i in tasks
-            }
-            
-            # Process results as they complete
-            with tqdm(total=len(tasks), desc="Downloading images") as pbar:
-                for future in as_completed(future_to_task):
-                    result = future.result()
-                    results.append(result)
-                    
-                    if result['status'] == 'failed':
-                        failed_downloads.append(result)
-                    
-                    pbar.update(1)
+        # Download images in parallel: one asyncio event loop when aiohttp
+        # is installed (scales far beyond the thread pool at near-zero
+        # per-connection overhead), otherwise the thread pool
+        if aiohttp is not None:
+            results = asyncio.run(self._download_all_async(tasks))
+            failed_downloads = [r for r in results if r['status'] == 'failed']
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # Submit all tasks
+                future_to_task = {
+                    executor.submit(self.download_image, url, filename, i): (url, filename, i)
+                    for url, filename, i in tasks
+                }
+
+                # Process results as they complete
+                with tqdm(total=len(tasks), desc="Downloading images") as pbar:
+                    for future in as_completed(future_to_task):
+                        result = future.result()
+                        results.append(result)
+
+                        if result['status'] == 'failed':
+                            failed_downloads.append(result)
+
+                        pbar.update(1)
         
         # Generate summary report
         self.generate_report(results)
@@ -221,8 +376,13 @@ class ExcelImageDownloader:
     
     def save_failed_downloads(self, failed_downloads):
         """Save failed downloads to a CSV file for retry"""
-        failed_df = pd.DataFrame(failed_downloads)
-        failed_df.to_csv('failed_downloads.csv', index=False)
+        # Flat list of dicts: stdlib csv writes it directly without
+        # pandas' frame construction and dtype inference
+        with open('failed_downloads.csv', 'w', newline='') as f:
+            writer = csv.DictWriter(
+                f, fieldnames=['index', 'url', 'filename', 'status', 'error'])
+            writer.writeheader()
+            writer.writerows(failed_downloads)
         logger.info(f"Saved {len(failed_downloads)} failed downloads to failed_downloads.csv")
 
 def main():
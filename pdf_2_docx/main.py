@@ -1,24 +1,147 @@
+import hashlib
 import os
+import queue
 import tempfile
+import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
+from collections import OrderedDict
+from functools import lru_cache
+from multiprocessing import Pool
+import numpy as np
 from pdf2docx import Converter
 import fitz  # PyMuPDF
 from PIL import Image, ImageTk
 from docx import Document
 
+# pypdfium2 renders with lower peak memory than PyMuPDF, whose internal
+# store retains buffers across get_pixmap calls. Optional backend for the
+# on-demand renders; PyMuPDF stays the fallback (and drives the warm-up
+# pool, which ships raw bytes between processes).
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# OpenCV's SIMD INTER_AREA downscale beats PIL's filters on both speed
+# and quality for shrinking; optional, PIL resize stays the fallback
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+# Hot-path callables bound once at import time; each use is then a fast
+# global load instead of a module attribute lookup per rendered page
+_Matrix = fitz.Matrix
+_fromarray = Image.fromarray
+_PhotoImage = ImageTk.PhotoImage
+
+# How many rendered preview pages to keep in memory
+PREVIEW_CACHE_SIZE = 8
+
+# Workers for the initial preview warm-up; beyond 4 the cost of copying
+# pixel buffers back outweighs the extra parallelism
+RENDER_POOL_SIZE = 4
+
+# Above either threshold the warm-up pool is skipped entirely: spinning
+# up workers against a huge scanned PDF burns CPU and memory on pages
+# the user may never look at. Such documents render one page at a time
+# on navigation instead.
+WARM_MAX_BYTES = 50 * 1024 * 1024
+WARM_MAX_PAGES = 200
+
+# Rendered previews are cached as PNGs in the temp dir so re-opening the
+# same PDF skips rasterization; tiny files aren't worth the cache churn
+DISK_CACHE_DIR = os.path.join(tempfile.gettempdir(), "pdf2docx_preview")
+DISK_CACHE_MIN_BYTES = 1024 * 1024
+
+
+def _render_page_worker(pdf_path, page_num, zoom, gray=False, cache_file=None):
+    """Rasterize one page in a worker process and return raw pixel bytes.
+
+    Top-level (not a method) so multiprocessing can pickle it.
+    """
+    doc = fitz.open(pdf_path)
+    try:
+        page = doc.load_page(page_num)
+        colorspace = fitz.csGRAY if gray else fitz.csRGB
+        pix = page.get_pixmap(matrix=_Matrix(zoom, zoom), colorspace=colorspace)
+        if cache_file:
+            try:
+                _image_from_samples(pix.samples, pix.width, pix.height,
+                                    gray).save(cache_file, optimize=True)
+            except Exception:
+                pass
+        # pix.samples is already a bytes object; no extra copy needed
+        return page_num, pix.width, pix.height, pix.samples
+    finally:
+        doc.close()
+        # Empty MuPDF's internal store; it otherwise retains decoded
+        # resources (fonts, images) across get_pixmap calls
+        fitz.TOOLS.store_shrink(100)
+
+
+def _render_page_star(args):
+    return _render_page_worker(*args)
+
+
+@lru_cache(maxsize=32)
+def _fit_size(src_w, src_h, box_w, box_h):
+    """Largest size preserving aspect ratio that fits inside the box.
+
+    Cached: every page of a document shares one geometry, so the ratio
+    math runs once per (source, box) pair rather than on every flip.
+    """
+    scale = min(box_w / src_w, box_h / src_h, 1.0)
+    return max(int(src_w * scale), 1), max(int(src_h * scale), 1)
+
+
+def _image_from_samples(samples, width, height, gray=False):
+    """Wrap raw RGB or grayscale samples as a PIL image without copying.
+
+    Image.frombytes copies the whole buffer again; np.frombuffer shares
+    the memory of the samples bytes (which outlive the pixmap), so the
+    only copy per page is the one MuPDF makes producing pix.samples.
+    """
+    arr = np.frombuffer(samples, dtype=np.uint8)
+    if gray:
+        return _fromarray(arr.reshape(height, width), mode="L")
+    return _fromarray(arr.reshape(height, width, 3), mode="RGB")
+
 class PDFtoDOCXConverter:
     def __init__(self, root):
         self.root = root
         self.root.title("PDF to DOCX Converter with Preview")
         self.root.geometry("1000x700")
-        
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
         self.pdf_path = None
-        self.preview_images = []
+        self.pdf_bytes = None
+        self.pdf_document = None
+        self.total_pages = 0
+        self.preview_zoom = 150/72  # recomputed per document from canvas size
+        # BILINEAR (2 taps) is indistinguishable from LANCZOS (6 taps) at
+        # preview sizes; keep LANCZOS for export-quality paths only
+        self.preview_resample = Image.Resampling.BILINEAR
+
+        # One reused PhotoImage + canvas item; recreated only when the
+        # displayed size or mode changes
+        self._tk_photo = None
+        self._photo_size = None
+        self._photo_mode = None
+        self._canvas_img = None
+        # LRU cache of rendered pages, keyed by page index
+        self.page_cache = OrderedDict()
         self.current_page = 0
-        
+
+        # Rendering happens on worker threads; finished pages arrive on
+        # this queue and are drained periodically from the Tk event loop
+        self.render_queue = queue.Queue()
+        self.pending_pages = set()
+
         self.setup_ui()
-        
+        self.root.after(50, self.drain_render_queue)
+
     def setup_ui(self):
         # Top frame for file selection
         top_frame = tk.Frame(self.root)
@@ -67,14 +190,23 @@ class PDFtoDOCXConverter:
         tk.Label(range_frame, text=" to ").pack(side=tk.LEFT, padx=2)
         self.end_page = tk.Entry(range_frame, width=8)
         self.end_page.pack(side=tk.LEFT)
-        
+
+        # Grayscale preview renders one channel instead of three: ~3x less
+        # pixel memory and resize work for text-heavy PDFs
+        self.gray_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(convert_frame, text="Grayscale preview",
+                       variable=self.gray_var,
+                       command=self.on_gray_toggle).pack(anchor=tk.W, padx=10, pady=(10, 0))
+
         # Progress bar
         self.progress = ttk.Progressbar(convert_frame, mode='indeterminate')
         self.progress.pack(fill=tk.X, padx=10, pady=20)
         
-        # Convert button
-        tk.Button(convert_frame, text="Convert to DOCX", command=self.convert_pdf,
-                 bg="#2196F3", fg="white", padx=30, pady=10).pack(pady=20)
+        # Convert button; disabled while a conversion thread is running
+        self.convert_btn = tk.Button(convert_frame, text="Convert to DOCX",
+                                     command=self.convert_pdf,
+                                     bg="#2196F3", fg="white", padx=30, pady=10)
+        self.convert_btn.pack(pady=20)
         
         # Status label
         self.status_label = tk.Label(convert_frame, text="Ready", fg="gray")
@@ -87,48 +219,246 @@ class PDFtoDOCXConverter:
         
         if file_path:
             self.pdf_path = file_path
+            # Read the file once; preview renders and the converter reuse
+            # these bytes instead of re-reading the PDF from disk
+            try:
+                with open(file_path, 'rb') as f:
+                    self.pdf_bytes = f.read()
+            except OSError as e:
+                messagebox.showerror("Error", f"Failed to read PDF: {str(e)}")
+                return
             self.file_label.config(text=os.path.basename(file_path))
             self.load_pdf_preview(file_path)
             
     def load_pdf_preview(self, pdf_path):
         try:
-            # Clear previous preview
-            self.preview_images = []
+            # Clear previous preview and keep the document open; pages are
+            # rendered lazily on navigation instead of 10 upfront
+            self.page_cache.clear()
+            self.pending_pages.clear()
             self.current_page = 0
-            
-            # Open PDF
-            pdf_document = fitz.open(pdf_path)
-            self.total_pages = len(pdf_document)
-            
-            # Convert each page to image
-            for page_num in range(min(10, self.total_pages)):  # Limit to first 10 pages for performance
-                page = pdf_document.load_page(page_num)
-                pix = page.get_pixmap(matrix=fitz.Matrix(150/72, 150/72))  # 150 DPI
-                img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                self.preview_images.append(img)
-            
-            pdf_document.close()
-            
+
+            if self.pdf_document is not None:
+                self.pdf_document.close()
+                # Release resources cached for the previous document
+                # before loading the next one
+                fitz.TOOLS.store_shrink(100)
+            self.pdf_document = fitz.open(stream=self.pdf_bytes, filetype="pdf")
+            self.total_pages = len(self.pdf_document)
+
+            # Render directly at display size: compute the zoom that fits
+            # the canvas instead of rasterizing at a fixed 150 DPI and
+            # Lanczos-downscaling on every page flip
+            self.root.update_idletasks()
+            canvas_w = self.canvas.winfo_width() - 20
+            canvas_h = self.canvas.winfo_height() - 20
+            if canvas_w < 50 or canvas_h < 50:
+                canvas_w, canvas_h = 550, 700  # canvas not realized yet
+            # 1.2x oversample keeps text crisp through the final fit
+            # clamp while staying within ~1.4x of the displayed pixel
+            # count (vs 5.6x wasted at a fixed 150 DPI); the zoom clamp
+            # guards against degenerate page or canvas sizes
+            page_rect = self.pdf_document.load_page(0).rect
+            zoom = min(canvas_w / page_rect.width,
+                       canvas_h / page_rect.height) * 1.2
+            self.preview_zoom = min(max(zoom, 0.5), 3.0)
+
+            # Pre-render the first pages across a process pool in the
+            # background; mark them pending so render_page doesn't start
+            # duplicate single-page workers for them. Large PDFs skip the
+            # warm-up: only the page being viewed is rendered, lazily
+            if (len(self.pdf_bytes) <= WARM_MAX_BYTES
+                    and self.total_pages <= WARM_MAX_PAGES):
+                warm_count = min(PREVIEW_CACHE_SIZE, self.total_pages)
+                self.pending_pages.update(range(warm_count))
+                threading.Thread(target=self._warm_preview_cache,
+                                 args=(pdf_path, warm_count, self.gray_var.get()),
+                                 daemon=True).start()
+
             # Update page label
             self.update_page_display()
-            
+
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load PDF: {str(e)}")
-            
+
+    def render_page(self, page_num):
+        # Return the cached page, or kick off a background render and
+        # return None; drain_render_queue refreshes the canvas on arrival
+        img = self.page_cache.get(page_num)
+        if img is not None:
+            self.page_cache.move_to_end(page_num)
+            return img
+
+        if page_num not in self.pending_pages:
+            self.pending_pages.add(page_num)
+            threading.Thread(target=self._render_worker,
+                             args=(self.pdf_path, page_num, self.gray_var.get(),
+                                   self.pdf_bytes),
+                             daemon=True).start()
+        return None
+
+    def _disk_cache_path(self, pdf_path, page_num, gray):
+        # Cache key covers everything that affects the rendered pixels;
+        # returns None for PDFs too small to be worth caching
+        try:
+            if os.path.getsize(pdf_path) < DISK_CACHE_MIN_BYTES:
+                return None
+            mtime = os.path.getmtime(pdf_path)
+        except OSError:
+            return None
+        key = hashlib.sha1(
+            f"{pdf_path}:{mtime}:{page_num}:{self.preview_zoom:.3f}:{int(gray)}".encode()
+        ).hexdigest()
+        os.makedirs(DISK_CACHE_DIR, exist_ok=True)
+        return os.path.join(DISK_CACHE_DIR, key + ".png")
+
+    def _load_cached_preview(self, cache_file):
+        if cache_file and os.path.exists(cache_file):
+            try:
+                img = Image.open(cache_file)
+                img.load()
+                return img
+            except Exception:
+                pass
+        return None
+
+    def _warm_preview_cache(self, pdf_path, page_count, gray):
+        # Farm the initial renders out to worker processes and stream the
+        # results onto the same queue the single-page threads use, so the
+        # first finished page (usually page 1) shows as soon as it lands.
+        # Pages already in the disk cache skip rendering entirely.
+        try:
+            jobs = []
+            for i in range(page_count):
+                cache_file = self._disk_cache_path(pdf_path, i, gray)
+                img = self._load_cached_preview(cache_file)
+                if img is not None:
+                    self.render_queue.put((pdf_path, i, gray, img))
+                else:
+                    jobs.append((pdf_path, i, self.preview_zoom, gray, cache_file))
+            with Pool(min(os.cpu_count() or 1, RENDER_POOL_SIZE)) as pool:
+                for page_num, width, height, samples in pool.imap_unordered(_render_page_star, jobs):
+                    img = _image_from_samples(samples, width, height, gray)
+                    self.render_queue.put((pdf_path, page_num, gray, img))
+        except Exception:
+            # Pool setup can fail where plain threads still work (e.g.
+            # spawn restrictions): render the warm pages serially through
+            # the single-page worker instead of abandoning them
+            for i in range(page_count):
+                if pdf_path != self.pdf_path:
+                    break  # another document was opened meanwhile
+                if i not in self.page_cache:
+                    self._render_worker(pdf_path, i, gray, self.pdf_bytes)
+
+    def _render_worker(self, pdf_path, page_num, gray=False, pdf_bytes=None):
+        # Runs off the Tk thread. Opens its own document: MuPDF objects
+        # must not be shared between threads. Opens from the in-memory
+        # bytes when available, skipping a disk read per render (the
+        # warm-up pool still opens by path so jobs stay cheap to pickle)
+        img = None
+        zoom = self.preview_zoom
+
+        cache_file = self._disk_cache_path(pdf_path, page_num, gray)
+        img = self._load_cached_preview(cache_file)
+        if img is not None:
+            self.render_queue.put((pdf_path, page_num, gray, img))
+            return
+
+        if pdfium is not None:
+            try:
+                pdf = pdfium.PdfDocument(pdf_bytes if pdf_bytes is not None
+                                         else pdf_path)
+                try:
+                    bitmap = pdf[page_num].render(scale=zoom, grayscale=gray)
+                    img = bitmap.to_pil()
+                    if not gray and img.mode != "RGB":
+                        img = img.convert("RGB")
+                finally:
+                    pdf.close()
+            except Exception:
+                img = None  # pdfium choked on this page; try MuPDF below
+
+        if img is None:
+            try:
+                if pdf_bytes is not None:
+                    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+                else:
+                    doc = fitz.open(pdf_path)
+                try:
+                    page = doc.load_page(page_num)
+                    colorspace = fitz.csGRAY if gray else fitz.csRGB
+                    pix = page.get_pixmap(matrix=_Matrix(zoom, zoom),
+                                          colorspace=colorspace)
+                    img = _image_from_samples(pix.samples, pix.width, pix.height, gray)
+                    pix = None  # release MuPDF pixmap buffer promptly
+                finally:
+                    doc.close()
+                    # Drop MuPDF's cached resources so preview memory
+                    # stays bounded by the page cache, not the store
+                    fitz.TOOLS.store_shrink(100)
+            except Exception:
+                pass
+        if cache_file and img is not None:
+            try:
+                img.save(cache_file, optimize=True)
+            except Exception:
+                pass
+        self.render_queue.put((pdf_path, page_num, gray, img))
+
+    def drain_render_queue(self):
+        try:
+            while True:
+                pdf_path, page_num, gray, img = self.render_queue.get_nowait()
+                self.pending_pages.discard(page_num)
+                if pdf_path != self.pdf_path or gray != self.gray_var.get():
+                    continue  # stale: other document or colorspace toggled
+                if img is not None:
+                    self.page_cache[page_num] = img
+                    while len(self.page_cache) > PREVIEW_CACHE_SIZE:
+                        self.page_cache.popitem(last=False)
+                    if page_num == self.current_page:
+                        self.update_page_display()
+                elif page_num == self.current_page:
+                    # Every renderer failed on this page: replace the
+                    # placeholder so it isn't stuck on "Rendering..."
+                    self.canvas.delete("all")
+                    self._canvas_img = None
+                    self.canvas.create_text(275, 350, text="Failed to render page",
+                                            fill="red")
+        except queue.Empty:
+            pass
+        self.root.after(50, self.drain_render_queue)
+
     def update_page_display(self):
-        if self.preview_images:
-            # Display current page
-            img = self.preview_images[self.current_page]
-            img.thumbnail((550, 700), Image.Resampling.LANCZOS)
-            photo = ImageTk.PhotoImage(img)
-            
-            self.canvas.delete("all")
-            self.canvas.create_image(10, 10, anchor=tk.NW, image=photo)
-            self.canvas.image = photo  # Keep reference
-            
+        if self.pdf_document is not None and self.total_pages > 0:
+            # Display current page, or a placeholder until the worker
+            # thread delivers it
+            img = self.render_page(self.current_page)
+            if img is None:
+                self.canvas.delete("all")
+                self._canvas_img = None
+                self.canvas.create_text(275, 350, text="Rendering...", fill="gray40")
+                self.page_label.config(text=f"Page {self.current_page + 1} of {self.total_pages}")
+                return
+            # Pages are rendered at display size; clamp only stale cache
+            # entries rendered for a larger canvas (e.g. after a window
+            # shrink), with the cheap preview resample filter
+            canvas_w = self.canvas.winfo_width() - 20
+            canvas_h = self.canvas.winfo_height() - 20
+            if canvas_w < 50 or canvas_h < 50:
+                canvas_w, canvas_h = 550, 700
+            if img.width > canvas_w or img.height > canvas_h:
+                new_size = _fit_size(img.width, img.height, canvas_w, canvas_h)
+                if cv2 is not None:
+                    img = _fromarray(cv2.resize(np.asarray(img), new_size,
+                                                interpolation=cv2.INTER_AREA))
+                else:
+                    img = img.resize(new_size, self.preview_resample)
+            self._show_page_image(img)
+
             # Update page label
-            self.page_label.config(text=f"Page {self.current_page + 1} of {len(self.preview_images)}")
-            
+            self.page_label.config(text=f"Page {self.current_page + 1} of {self.total_pages}")
+
             # Update range fields
             if not self.start_page.get():
                 self.start_page.delete(0, tk.END)
@@ -136,16 +466,58 @@ class PDFtoDOCXConverter:
             if not self.end_page.get():
                 self.end_page.delete(0, tk.END)
                 self.end_page.insert(0, str(self.total_pages))
-    
+
+            # A user who just flipped forward will likely flip again:
+            # warm the next page once the UI goes idle
+            self.root.after_idle(self._prefetch, self.current_page + 1)
+
+    def _show_page_image(self, img):
+        # Paste into one reused PhotoImage instead of allocating a fresh
+        # Tk image (and its display-server copy) on every page flip. The
+        # fast path also requires the canvas item to still exist: the
+        # "Rendering..." placeholder deletes it but keeps the PhotoImage
+        if (self._tk_photo is not None and self._canvas_img is not None
+                and img.size == self._photo_size
+                and img.mode == self._photo_mode):
+            self._tk_photo.paste(img)
+            return
+
+        self.canvas.delete("all")
+        self._tk_photo = _PhotoImage(img)
+        self._photo_size = img.size
+        self._photo_mode = img.mode
+        self._canvas_img = self.canvas.create_image(10, 10, anchor=tk.NW,
+                                                    image=self._tk_photo)
+
+    def _prefetch(self, page_num):
+        if (self.pdf_document is not None
+                and 0 <= page_num < self.total_pages
+                and page_num not in self.page_cache):
+            # render_page dedupes via pending_pages and returns via the
+            # queue poller; we ignore the (None) miss result here
+            self.render_page(page_num)
+
     def next_page(self):
-        if self.preview_images and self.current_page < len(self.preview_images) - 1:
+        if self.pdf_document is not None and self.current_page < self.total_pages - 1:
             self.current_page += 1
             self.update_page_display()
-    
+
     def prev_page(self):
-        if self.preview_images and self.current_page > 0:
+        if self.pdf_document is not None and self.current_page > 0:
             self.current_page -= 1
             self.update_page_display()
+
+    def on_gray_toggle(self):
+        # Cached pages are in the old colorspace: drop them and re-render
+        self.page_cache.clear()
+        self.pending_pages.clear()
+        if self.pdf_document is not None:
+            self.update_page_display()
+
+    def on_close(self):
+        if self.pdf_document is not None:
+            self.pdf_document.close()
+        self.root.destroy()
     
     def convert_pdf(self):
         if not self.pdf_path:
@@ -161,42 +533,77 @@ class PDFtoDOCXConverter:
         if not save_path:
             return
         
+        # Validate the page range up front: no exception control flow, and
+        # bad input is rejected before the progress bar ever starts
+        start_text = self.start_page.get().strip() or "1"
+        end_text = self.end_page.get().strip() or str(self.total_pages)
+        if not (start_text.isdigit() and end_text.isdigit()):
+            messagebox.showerror("Error", "Please enter valid page numbers!")
+            return
+        start_page = int(start_text)
+        end_page = int(end_text)
+
+        # Validate range
+        if start_page < 1 or end_page > self.total_pages or start_page > end_page:
+            messagebox.showerror("Error", "Invalid page range!")
+            return
+
+        # Start conversion; update_idletasks flushes the label and
+        # progress redraw without pumping the whole event queue the
+        # way update() does (which can re-enter user callbacks).
+        # One conversion at a time: a second click during the worker's
+        # run would race it on the output file and the progress bar
+        self.convert_btn.config(state=tk.DISABLED)
+        self.status_label.config(text="Converting...", fg="blue")
+        self.progress.start()
+        self.root.update_idletasks()
+
+        # Run the blocking converter off the Tk thread so the UI
+        # stays responsive during multi-minute conversions
+        threading.Thread(target=self._do_convert,
+                         args=(save_path, start_page, end_page),
+                         daemon=True).start()
+
+    def _do_convert(self, save_path, start_page, end_page):
+        # Convert PDF to DOCX; pdf2docx can parse pages across cores,
+        # but fork/spawn overhead only pays off for larger jobs
         try:
-            # Get page range
-            start_page = int(self.start_page.get() or 1)
-            end_page = int(self.end_page.get() or self.total_pages)
-            
-            # Validate range
-            if start_page < 1 or end_page > self.total_pages or start_page > end_page:
-                messagebox.showerror("Error", "Invalid page range!")
-                return
-            
-            # Start conversion
-            self.status_label.config(text="Converting...", fg="blue")
-            self.progress.start()
-            self.root.update()
-            
-            # Convert PDF to DOCX
-            cv = Converter(self.pdf_path)
-            cv.convert(save_path, start=start_page-1, end=end_page-1)
+            if end_page - start_page >= 4:
+                # The multiprocessing workers reopen the document by its
+                # filename, so this branch must construct from the path;
+                # a stream-only Converter leaves filename_pdf unset and
+                # every worker fails
+                cv = Converter(self.pdf_path)
+                cv.convert(save_path, start=start_page-1, end=end_page-1,
+                           multi_processing=True,
+                           cpu_count=min(os.cpu_count() or 1, 4))
+            else:
+                # Small jobs run in-process and can reuse the bytes
+                # already loaded for the preview
+                cv = Converter(stream=self.pdf_bytes)
+                cv.convert(save_path, start=start_page-1, end=end_page-1)
             cv.close()
-            
-            # Stop progress bar
-            self.progress.stop()
-            self.status_label.config(text="Conversion Complete!", fg="green")
-            
-            # Ask to open the file
-            if messagebox.askyesno("Success", "Conversion completed successfully!\nOpen the document?"):
-                os.startfile(save_path)
-                
-        except ValueError:
-            messagebox.showerror("Error", "Please enter valid page numbers!")
-            self.progress.stop()
         except Exception as e:
-            messagebox.showerror("Error", f"Conversion failed: {str(e)}")
-            self.progress.stop()
-            self.status_label.config(text="Conversion Failed", fg="red")
-    
+            # Touch widgets only from the Tk thread
+            self.root.after(0, self._conversion_failed, str(e))
+            return
+        self.root.after(0, self._conversion_done, save_path)
+
+    def _conversion_done(self, save_path):
+        self.progress.stop()
+        self.convert_btn.config(state=tk.NORMAL)
+        self.status_label.config(text="Conversion Complete!", fg="green")
+
+        # Ask to open the file
+        if messagebox.askyesno("Success", "Conversion completed successfully!\nOpen the document?"):
+            os.startfile(save_path)
+
+    def _conversion_failed(self, error):
+        self.progress.stop()
+        self.convert_btn.config(state=tk.NORMAL)
+        messagebox.showerror("Error", f"Conversion failed: {error}")
+        self.status_label.config(text="Conversion Failed", fg="red")
+
     def run(self):
         self.root.mainloop()
 